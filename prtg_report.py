@@ -5,19 +5,26 @@ import numpy as np
 import json
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 from io import StringIO
 import urllib3
+from requests.adapters import HTTPAdapter
 
 urllib3.disable_warnings()
 
 try:
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
+    import xlsxwriter  # noqa: F401 - used through pd.ExcelWriter
 except ImportError:
-    print("✗ openpyxl is required. Install it with: pip install openpyxl")
+    print("✗ xlsxwriter is required. Install it with: pip install xlsxwriter")
     sys.exit(1)
 
+try:
+    import orjson  # optional, faster config parsing
+except ImportError:
+    orjson = None
+
 # ============================================================
 # LOAD CONFIGURATION FROM config.json
 # ============================================================
@@ -25,14 +32,14 @@ except ImportError:
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
 
 try:
-    with open(CONFIG_FILE, 'r') as f:
-        config = json.load(f)
+    with open(CONFIG_FILE, 'rb') as f:
+        config = orjson.loads(f.read()) if orjson else json.load(f)
 except FileNotFoundError:
     print(f"✗ Config file not found: {CONFIG_FILE}")
     sys.exit(1)
 
 PRTG_CONFIG = config['prtg']
-SENSORS = {int(k): v for k, v in config['sensors'].items()}
+SENSORS = dict(zip(map(int, config['sensors']), config['sensors'].values()))
 DAYS_TO_ANALYZE = config.get('days_to_analyze', 2)
 
 # ============================================================
@@ -44,47 +51,94 @@ BG_CARD = '16213e'
 BG_HEADER = '0f3460'
 ACCENT = '00d4ff'
 GREEN = '00e676'
+BLUE = '2979ff'
 YELLOW = 'ffab00'
 ORANGE = 'ff6d00'
 RED = 'ff1744'
 WHITE = 'ffffff'
 DIM = '8892a0'
 
-HEADER_FONT = Font(name='Calibri', bold=True, size=11, color=WHITE)
-HEADER_FILL = PatternFill(start_color=BG_HEADER, end_color=BG_HEADER, fill_type='solid')
-TITLE_FONT = Font(name='Calibri', bold=True, size=14, color=ACCENT)
-SUBTITLE_FONT = Font(name='Calibri', size=10, color=DIM)
-DATA_FONT = Font(name='Calibri', size=11, color=WHITE)
-DATA_BOLD = Font(name='Calibri', bold=True, size=11, color=WHITE)
-CARD_FILL = PatternFill(start_color=BG_CARD, end_color=BG_CARD, fill_type='solid')
-DARK_FILL = PatternFill(start_color=BG_DARK, end_color=BG_DARK, fill_type='solid')
-CENTER = Alignment(horizontal='center', vertical='center')
-LEFT = Alignment(horizontal='left', vertical='center')
-THIN_BORDER = Border(
-    left=Side(style='thin', color=BG_HEADER),
-    right=Side(style='thin', color=BG_HEADER),
-    top=Side(style='thin', color=BG_HEADER),
-    bottom=Side(style='thin', color=BG_HEADER),
-)
+DATE_FORMAT = 'yyyy-mm-dd hh:mm:ss'
+EXCEL_EPOCH = pd.Timestamp('1899-12-30')  # day 0 of Excel's 1900 date system
+
+def cell_format(wb, color=WHITE, bold=False, size=11, bg=BG_DARK, align=None, border=False, num_format=None):
+    """Create an xlsxwriter Format in the report's dark theme"""
+    props = {'font_name': 'Calibri', 'font_size': size, 'bold': bold,
+             'font_color': f'#{color}', 'bg_color': f'#{bg}'}
+    if align:
+        props.update(align=align, valign='vcenter')
+    if border:
+        props.update(border=1, border_color=f'#{BG_HEADER}')
+    if num_format:
+        props['num_format'] = num_format
+    return wb.add_format(props)
+
+def make_formats(wb):
+    """Pre-create the fixed formats shared by every sheet of a workbook"""
+    # Bordered table cells: identical (color, bold, bg, align) specs share one
+    # Format. Formats belong to a single workbook, so the cache lives here.
+    @lru_cache(maxsize=None)
+    def table_cell(color, bold, bg, align):
+        return cell_format(wb, color, bold=bold, bg=bg, align=align, border=True)
+
+    return {
+        'dark': cell_format(wb),
+        'report_title': cell_format(wb, ACCENT, bold=True, size=18, align='left'),
+        'title': cell_format(wb, ACCENT, bold=True, size=14),
+        'subtitle': cell_format(wb, DIM, size=10),
+        'footer': cell_format(wb, DIM, size=9),
+        'section': cell_format(wb, ACCENT, bold=True),
+        'header': table_cell(WHITE, True, BG_HEADER, 'center'),
+        # Striped data rows, indexed by row parity: even -> dark, odd -> card
+        'data': tuple(table_cell(WHITE, False, bg, 'center') for bg in (BG_DARK, BG_CARD)),
+        'date': tuple(cell_format(wb, bg=bg, align='center', border=True, num_format=DATE_FORMAT)
+                      for bg in (BG_DARK, BG_CARD)),
+        'cell': table_cell,
+    }
 
-def colored_font(color, bold=False, size=11):
-    return Font(name='Calibri', bold=bold, size=size, color=color)
+def unique_sheet_name(wb, name):
+    """Append a counter to a duplicate sheet name (Excel names are case-insensitive)"""
+    taken = {ws.get_name().lower() for ws in wb.worksheets()}
+    candidate, n = name, 1
+    while candidate.lower() in taken:
+        candidate = f"{name}{n}"
+        n += 1
+    return candidate
+
+# Std dev upper bounds (exclusive) for each stability class; NaN sorts last
+STABILITY_EDGES = np.array([1.0, 2.0, 3.0])
+STABILITY_CLASSES = (
+    ("VERY STABLE", GREEN),
+    ("STABLE", BLUE),
+    ("VARIABLE", YELLOW),
+    ("HIGHLY VARIABLE", RED),
+)
 
 def get_stability(std):
-    if std < 1.0:
-        return "VERY STABLE", GREEN
-    elif std < 2.0:
-        return "STABLE", '2979ff'
-    elif std < 3.0:
-        return "VARIABLE", YELLOW
-    else:
-        return "HIGHLY VARIABLE", RED
+    return STABILITY_CLASSES[int(np.searchsorted(STABILITY_EDGES, std, side='right'))]
+
+THRESHOLD_COLORS = (GREEN, ORANGE, RED)  # indexed by severity: ok, warning, error
+
+def get_threshold_color(temp, ue, uw, lw, le):
+    """Color for a reading by the error/warning band it falls in"""
+    # Bands are inclusive on both sides: temp >= uw/ue or temp <= lw/le
+    upper = np.digitize(temp, (uw, ue))
+    lower = 2 - np.digitize(temp, (le, lw), right=True)
+    return THRESHOLD_COLORS[max(upper, lower)]
 
 # ============================================================
 # PRTG DATA FETCHING
 # ============================================================
 
-def fetch_sensor_history(sensor_id):
+def create_session(pool_size):
+    """Keep-alive session shared by all sensor fetches"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def fetch_sensor_history(sensor_id, session, log=print):
     """Fetch historical data from PRTG"""
     end_date = datetime.now()
     start_date = end_date - timedelta(days=DAYS_TO_ANALYZE)
@@ -98,10 +152,10 @@ def fetch_sensor_history(sensor_id):
         'password': PRTG_CONFIG['password'],
     }
 
-    print(f"  Fetching data (last {DAYS_TO_ANALYZE} days)...")
+    log(f"  Fetching data (last {DAYS_TO_ANALYZE} days)...")
 
     try:
-        response = requests.get(
+        response = session.get(
             f"{PRTG_CONFIG['url']}/api/historicdata.csv",
             params=params,
             verify=False,
@@ -109,64 +163,77 @@ def fetch_sensor_history(sensor_id):
         )
 
         if response.status_code == 200:
-            print(f"  ✓ Retrieved ({len(response.text)} bytes)")
+            log(f"  ✓ Retrieved ({len(response.text)} bytes)")
             return response.text
         else:
-            print(f"  ✗ HTTP {response.status_code}: {response.text[:150]}")
+            log(f"  ✗ HTTP {response.status_code}: {response.text[:150]}")
             return None
 
     except Exception as e:
-        print(f"  ✗ Connection error: {e}")
+        log(f"  ✗ Connection error: {e}")
         return None
 
-def parse_csv_data(csv_data):
+def parse_csv_data(csv_data, log=print):
     """Parse PRTG CSV data into a clean DataFrame"""
-    df = pd.read_csv(StringIO(csv_data))
-
-    # Drop summary rows
-    df = df[df['Date Time'].str.match(r'^\d', na=False)].copy()
-
-    # Find temperature column
-    tempc_cols = [col for col in df.columns if 'tempc' in col.lower() and '(raw)' not in col.lower()]
-    temp_cols = [col for col in df.columns if 'temperature' in col.lower() or '(c)' in col.lower()]
+    # Find temperature column from the header alone
+    columns = pd.read_csv(StringIO(csv_data), nrows=0).columns
+    tempc_cols = [col for col in columns if 'tempc' in col.lower() and '(raw)' not in col.lower()]
+    temp_cols = [col for col in columns if 'temperature' in col.lower() or '(c)' in col.lower()]
 
     if tempc_cols:
         temp_col = tempc_cols[0]
     elif temp_cols:
         temp_col = temp_cols[0]
     else:
-        print("  ✗ No temperature column found!")
+        log("  ✗ No temperature column found!")
         return None
 
-    print(f"  ✓ Column: '{temp_col}'")
+    log(f"  ✓ Column: '{temp_col}'")
+
+    # Read only the columns we keep. 'Date Time' is forced to str: pyarrow
+    # types every column of a header-only CSV (paused sensor) as float64.
+    usecols = ['Date Time', temp_col]
+    dtype = {'Date Time': str}
+    try:
+        df = pd.read_csv(StringIO(csv_data), engine='pyarrow', usecols=usecols, dtype=dtype)
+    except ImportError:
+        df = pd.read_csv(StringIO(csv_data), usecols=usecols, dtype=dtype)
+
+    # Drop summary rows ("Averages", "Sums") - readings start with a date
+    df = df[df['Date Time'].str[:1].str.isdigit().eq(True)]
 
     # Parse datetime
-    df['DateTime'] = pd.to_datetime(
+    dt = pd.to_datetime(
         df['Date Time'].str.split(' - ').str[0],
         format='%d.%m.%Y %H:%M:%S'
     )
 
-    # Clean temperature data
-    df[temp_col] = df[temp_col].astype(str).str.replace(r'[^0-9.\-]', '', regex=True)
-    df[temp_col] = pd.to_numeric(df[temp_col], errors='coerce')
-    df = df.dropna(subset=[temp_col])
-
-    print(f"  ✓ {len(df)} valid readings")
+    # Clean temperature data; PRTG may append a unit to each value ("22 °C")
+    temps = pd.to_numeric(df[temp_col], errors='coerce')
+    if temps.isna().all():
+        temps = pd.to_numeric(
+            df[temp_col].astype(str).str.extract(r'(-?\d+\.?\d*)', expand=False),
+            errors='coerce'
+        )
+    df = pd.DataFrame({'DateTime': dt, 'Temperature': temps}).dropna(subset=['Temperature'])
 
-    df = df[['DateTime', temp_col]].rename(columns={temp_col: 'Temperature'})
+    log(f"  ✓ {len(df)} valid readings")
     return df
 
 def compute_stats(df):
     """Compute all stats for a sensor DataFrame"""
-    temps = df['Temperature']
-    days = (df['DateTime'].max() - df['DateTime'].min()).days
+    arr = df['Temperature'].to_numpy(dtype=np.float64, copy=False)
+    dt = df['DateTime'].to_numpy()
+    days = int((dt.max() - dt.min()) // np.timedelta64(1, 'D'))
+
+    p01, p05, p25, p50, p75, p95, p99 = np.percentile(arr, [1, 5, 25, 50, 75, 95, 99])
 
-    current = temps.iloc[-1]
-    avg = temps.mean()
-    mn = temps.min()
-    mx = temps.max()
+    current = arr[-1]
+    avg = arr.mean()
+    mn = arr.min()
+    mx = arr.max()
     rng = mx - mn
-    std = temps.std()
+    std = arr.std(ddof=1) if len(arr) > 1 else np.nan  # sample std, NaN like pandas
     stability, stab_color = get_stability(std)
 
     if days < 7:
@@ -176,10 +243,7 @@ def compute_stats(df):
         le = avg - 3.0
         threshold_note = "Conservative estimates (limited data)"
     else:
-        ue = temps.quantile(0.99)
-        uw = temps.quantile(0.95)
-        lw = temps.quantile(0.05)
-        le = temps.quantile(0.01)
+        ue, uw, lw, le = p99, p95, p05, p01
         threshold_note = "Based on statistical analysis"
 
     return {
@@ -189,126 +253,102 @@ def compute_stats(df):
         'stability': stability, 'stab_color': stab_color,
         'ue': ue, 'uw': uw, 'lw': lw, 'le': le,
         'threshold_note': threshold_note,
-        'p01': temps.quantile(0.01), 'p05': temps.quantile(0.05),
-        'p25': temps.quantile(0.25), 'p50': temps.quantile(0.50),
-        'p75': temps.quantile(0.75), 'p95': temps.quantile(0.95),
-        'p99': temps.quantile(0.99),
+        'p01': p01, 'p05': p05,
+        'p25': p25, 'p50': p50,
+        'p75': p75, 'p95': p95,
+        'p99': p99,
     }
 
+def analyze_sensor(sensor_id, session, log=print):
+    """Fetch, parse and compute stats for one sensor; None if it has no data"""
+    csv_data = fetch_sensor_history(sensor_id, session, log)
+    if not csv_data:
+        return None
+
+    df = parse_csv_data(csv_data, log)
+    if df is None or len(df) == 0:
+        log(f"  ✗ No valid data. Skipping.")
+        return None
+
+    return compute_stats(df)
+
 # ============================================================
 # EXCEL REPORT GENERATION
 # ============================================================
 
-def write_summary_sheet(ws, sensor_results):
+def write_summary_sheet(ws, sensor_results, fmt):
     """Sheet 1: Summary table of all sensors"""
-    # Dark background
-    for row in range(1, 50):
-        for col in range(1, 20):
-            ws.cell(row=row, column=col).fill = DARK_FILL
+    ws.hide_gridlines(2)
 
-    # Column widths
-    for i, w in enumerate([22, 12, 10, 10, 10, 10, 10, 14, 12, 12, 12, 12], 1):
-        ws.column_dimensions[get_column_letter(i)].width = w
+    # Column widths, with a dark background for blank cells
+    for i, w in enumerate([22, 12, 10, 10, 10, 10, 10, 14, 12, 12, 12, 12]):
+        ws.set_column(i, i, w, fmt['dark'])
 
     # Title
-    ws.merge_cells('A1:L1')
-    c = ws['A1']
-    c.value = 'PRTG Temperature Sensor Report'
-    c.font = Font(name='Calibri', bold=True, size=18, color=ACCENT)
-    c.fill = DARK_FILL
-    c.alignment = LEFT
-
-    ws.merge_cells('A2:L2')
-    c = ws['A2']
-    c.value = datetime.now().strftime('%B %d, %Y  %H:%M')
-    c.font = SUBTITLE_FONT
-    c.fill = DARK_FILL
+    ws.merge_range(0, 0, 0, 11, 'PRTG Temperature Sensor Report', fmt['report_title'])
+    ws.merge_range(1, 0, 1, 11, datetime.now().strftime('%B %d, %Y  %H:%M'), fmt['subtitle'])
 
     # Headers
     headers = ['Sensor', 'Current', 'Avg', 'Min', 'Max', 'Range',
                'Std Dev', 'Stability', 'Upper Err', 'Upper Warn',
                'Lower Warn', 'Lower Err']
-    for col, h in enumerate(headers, 1):
-        cell = ws.cell(row=4, column=col, value=h)
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = CENTER
-        cell.border = THIN_BORDER
+    for col, h in enumerate(headers):
+        ws.write(3, col, h, fmt['header'])
 
     # Data rows
-    row_num = 5
+    row_num = 4
     for sid, (name, s) in sensor_results.items():
-        # Current temp color
-        if s['current'] >= s['ue'] or s['current'] <= s['le']:
-            cur_color = RED
-        elif s['current'] >= s['uw'] or s['current'] <= s['lw']:
-            cur_color = ORANGE
-        else:
-            cur_color = GREEN
+        cur_color = get_threshold_color(s['current'], s['ue'], s['uw'], s['lw'], s['le'])
 
-        row_fill = CARD_FILL if (row_num - 5) % 2 == 0 else DARK_FILL
+        row_bg = BG_CARD if (row_num - 4) % 2 == 0 else BG_DARK
 
         values = [
-            (f'{name} ({sid})', DATA_BOLD, LEFT),
-            (round(s['current'], 1), colored_font(cur_color, bold=True), CENTER),
-            (round(s['avg'], 1), DATA_FONT, CENTER),
-            (round(s['min'], 1), DATA_FONT, CENTER),
-            (round(s['max'], 1), DATA_FONT, CENTER),
-            (round(s['range'], 1), DATA_FONT, CENTER),
-            (round(s['std'], 2), DATA_FONT, CENTER),
-            (s['stability'], colored_font(s['stab_color'], bold=True), CENTER),
-            (round(s['ue'], 1), colored_font(RED), CENTER),
-            (round(s['uw'], 1), colored_font(ORANGE), CENTER),
-            (round(s['lw'], 1), colored_font(ORANGE), CENTER),
-            (round(s['le'], 1), colored_font(RED), CENTER),
+            (f'{name} ({sid})', WHITE, True, 'left'),
+            (round(s['current'], 1), cur_color, True, 'center'),
+            (round(s['avg'], 1), WHITE, False, 'center'),
+            (round(s['min'], 1), WHITE, False, 'center'),
+            (round(s['max'], 1), WHITE, False, 'center'),
+            (round(s['range'], 1), WHITE, False, 'center'),
+            (round(s['std'], 2), WHITE, False, 'center'),
+            (s['stability'], s['stab_color'], True, 'center'),
+            (round(s['ue'], 1), RED, False, 'center'),
+            (round(s['uw'], 1), ORANGE, False, 'center'),
+            (round(s['lw'], 1), ORANGE, False, 'center'),
+            (round(s['le'], 1), RED, False, 'center'),
         ]
 
-        for col, (val, font, align) in enumerate(values, 1):
-            cell = ws.cell(row=row_num, column=col, value=val)
-            cell.font = font
-            cell.fill = row_fill
-            cell.alignment = align
-            cell.border = THIN_BORDER
+        for col, (val, color, bold, align) in enumerate(values):
+            if isinstance(val, float) and not np.isfinite(val):
+                val = None  # e.g. std of a single reading; written as a styled blank
+            ws.write(row_num, col, val,
+                     fmt['cell'](color, bold, row_bg, align))
 
         row_num += 1
 
     # Footer
     row_num += 1
-    ws.merge_cells(f'A{row_num}:L{row_num}')
-    c = ws.cell(row=row_num, column=1)
-    c.value = f'{len(sensor_results)} sensor(s)  |  Prepared by: Data Center Operations'
-    c.font = Font(name='Calibri', size=9, color=DIM)
-    c.fill = DARK_FILL
+    ws.merge_range(row_num, 0, row_num, 11,
+                   f'{len(sensor_results)} sensor(s)  |  Prepared by: Data Center Operations',
+                   fmt['footer'])
 
-def write_detailed_sheet(ws, sid, name, s):
+def write_detailed_sheet(ws, sid, name, s, fmt):
     """One sheet per sensor: stats, percentiles, hourly averages"""
-    ws.sheet_properties.tabColor = '2979ff'
-
-    # Dark background
-    for row in range(1, 80):
-        for col in range(1, 8):
-            ws.cell(row=row, column=col).fill = DARK_FILL
+    ws.set_tab_color(f'#{BLUE}')
+    ws.hide_gridlines(2)
 
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 15
-    for i in range(3, 8):
-        ws.column_dimensions[get_column_letter(i)].width = 14
+    # Column widths, with a dark background for blank cells
+    ws.set_column(0, 0, 25, fmt['dark'])
+    ws.set_column(1, 1, 15, fmt['dark'])
+    ws.set_column(2, 6, 14, fmt['dark'])
 
     df = s['df']
 
     # Sensor title
-    row_num = 1
-    ws.merge_cells(f'A{row_num}:D{row_num}')
-    c = ws.cell(row=row_num, column=1)
-    c.value = f"{name} (Sensor {sid})"
-    c.font = Font(name='Calibri', bold=True, size=14, color=ACCENT)
-    c.fill = DARK_FILL
+    row_num = 0
+    ws.merge_range(row_num, 0, row_num, 3, f"{name} (Sensor {sid})", fmt['title'])
     row_num += 1
 
-    c = ws.cell(row=row_num, column=1)
-    c.value = f"{s['days']} days  |  {len(df)} readings"
-    c.font = SUBTITLE_FONT
-    c.fill = DARK_FILL
+    ws.write(row_num, 0, f"{s['days']} days  |  {len(df)} readings", fmt['subtitle'])
     row_num += 2
 
     # Stats
@@ -341,102 +381,77 @@ def write_detailed_sheet(ws, sid, name, s):
 
     for label, val in stat_rows:
         is_section = label in ('PERCENTILES', 'THRESHOLDS')
-        cl = ws.cell(row=row_num, column=1, value=label)
-        cv = ws.cell(row=row_num, column=2, value=val)
+        bg = BG_DARK if is_section else BG_CARD
 
         if is_section:
-            cl.font = colored_font(ACCENT, bold=True)
+            label_color, val_color, val_bold = ACCENT, WHITE, False
         elif label == 'Stability':
-            cl.font = DATA_FONT
-            cv.font = colored_font(s['stab_color'], bold=True)
+            label_color, val_color, val_bold = WHITE, s['stab_color'], True
         elif 'Error' in label:
-            cl.font = DATA_FONT
-            cv.font = colored_font(RED)
+            label_color, val_color, val_bold = WHITE, RED, False
         elif 'Warning' in label:
-            cl.font = DATA_FONT
-            cv.font = colored_font(ORANGE)
+            label_color, val_color, val_bold = WHITE, ORANGE, False
         else:
-            cl.font = DATA_FONT
-            cv.font = DATA_FONT
-
-        cl.fill = CARD_FILL if not is_section else DARK_FILL
-        cv.fill = CARD_FILL if not is_section else DARK_FILL
-        cl.alignment = LEFT
-        cv.alignment = CENTER
-        cl.border = THIN_BORDER
-        cv.border = THIN_BORDER
+            label_color, val_color, val_bold = WHITE, WHITE, False
+
+        ws.write(row_num, 0, label,
+                 fmt['cell'](label_color, is_section, bg, 'left'))
+        ws.write(row_num, 1, val,
+                 fmt['cell'](val_color, val_bold, bg, 'center'))
         row_num += 1
 
     # Hourly averages
     row_num += 1
-    c = ws.cell(row=row_num, column=1, value='HOURLY AVERAGES')
-    c.font = colored_font(ACCENT, bold=True)
-    c.fill = DARK_FILL
+    ws.write(row_num, 0, 'HOURLY AVERAGES', fmt['section'])
     row_num += 1
 
-    df_h = df.copy()
-    df_h['Hour'] = df_h['DateTime'].dt.hour
-    hourly = df_h.groupby('Hour')['Temperature'].agg(['mean', 'min', 'max'])
-
-    for h_col, h_label in enumerate(['Hour', 'Avg', 'Min', 'Max'], 1):
-        cell = ws.cell(row=row_num, column=h_col, value=h_label)
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = CENTER
-        cell.border = THIN_BORDER
+    hours = df['DateTime'].dt.hour.to_numpy()
+    temps = df['Temperature'].to_numpy()
+    counts = np.bincount(hours, minlength=24)
+    means = np.bincount(hours, weights=temps, minlength=24) / np.maximum(counts, 1)
+    mins = np.full(24, np.inf)
+    maxs = np.full(24, -np.inf)
+    np.minimum.at(mins, hours, temps)
+    np.maximum.at(maxs, hours, temps)
+
+    for h_col, h_label in enumerate(['Hour', 'Avg', 'Min', 'Max']):
+        ws.write(row_num, h_col, h_label, fmt['header'])
     row_num += 1
 
     for hour in range(24):
-        if hour in hourly.index:
-            r_fill = CARD_FILL if hour % 2 == 0 else DARK_FILL
-            for h_col, val in enumerate([f'{hour:02d}:00',
-                                          f"{hourly.loc[hour, 'mean']:.1f}",
-                                          f"{hourly.loc[hour, 'min']:.1f}",
-                                          f"{hourly.loc[hour, 'max']:.1f}"], 1):
-                cell = ws.cell(row=row_num, column=h_col, value=val)
-                cell.font = DATA_FONT
-                cell.fill = r_fill
-                cell.alignment = CENTER
-                cell.border = THIN_BORDER
+        if counts[hour]:
+            r_fmt = fmt['data'][1 - hour % 2]
+            ws.write_row(row_num, 0, [f'{hour:02d}:00',
+                                      f"{means[hour]:.1f}",
+                                      f"{mins[hour]:.1f}",
+                                      f"{maxs[hour]:.1f}"], r_fmt)
             row_num += 1
 
-def write_raw_sheets(writer, sensor_results):
+def write_raw_sheets(wb, sensor_results, fmt):
     """One sheet per sensor with raw DateTime + Temperature data"""
     for sid, (name, s) in sensor_results.items():
-        sheet_name = f"{name[:20]} ({sid})"
-        df = s['df'].copy()
-        df.to_excel(writer, sheet_name=sheet_name, index=False, startrow=1)
+        ws = wb.add_worksheet(f"{name[:20]} ({sid})")
+        ws.set_tab_color(f'#{BG_HEADER}')
+        df = s['df']
 
-        ws = writer.sheets[sheet_name]
-        ws.sheet_properties.tabColor = BG_HEADER
+        ws.set_column(0, 0, 22)
+        ws.set_column(1, 1, 14)
 
         # Title
-        ws.merge_cells('A1:B1')
-        c = ws['A1']
-        c.value = f"{name} - Raw Data"
-        c.font = TITLE_FONT
-        c.fill = DARK_FILL
-
-        # Style header
-        for col in range(1, 3):
-            cell = ws.cell(row=2, column=col)
-            cell.font = HEADER_FONT
-            cell.fill = HEADER_FILL
-            cell.alignment = CENTER
-            cell.border = THIN_BORDER
-
-        ws.column_dimensions['A'].width = 22
-        ws.column_dimensions['B'].width = 14
-
-        # Style data rows
-        for row in range(3, len(df) + 3):
-            r_fill = CARD_FILL if row % 2 == 0 else DARK_FILL
-            for col in range(1, 3):
-                cell = ws.cell(row=row, column=col)
-                cell.font = DATA_FONT
-                cell.fill = r_fill
-                cell.alignment = CENTER
-                cell.border = THIN_BORDER
+        ws.merge_range(0, 0, 0, 1, f"{name} - Raw Data", fmt['title'])
+
+        # Header
+        ws.write_row(1, 0, list(df.columns), fmt['header'])
+
+        # Data rows
+        # Convert all datetimes to Excel serial days in one vectorized step
+        serials = ((df['DateTime'] - EXCEL_EPOCH) / pd.Timedelta(days=1)).to_numpy()
+        temps = df['Temperature'].to_numpy()
+        stripes = tuple(zip(fmt['date'], fmt['data']))
+        for row, (serial, temp) in enumerate(zip(serials, temps), 2):
+            date_fmt, data_fmt = stripes[row % 2]
+            ws.write_number(row, 0, serial, date_fmt)
+            ws.write_number(row, 1, temp, data_fmt)
 
 # ============================================================
 # MAIN
@@ -447,22 +462,37 @@ def main():
     print("PRTG SENSOR REPORT")
     print("="*70)
 
-    # Step 1: Fetch and parse all sensor data
+    # Step 1: Fetch and analyze all sensors concurrently, report in config order
+    workers = max(1, min(16, len(SENSORS)))
+    session = create_session(workers)
+
+    analyzed = {}  # {sid: (log_lines, stats_dict)}
+
+    def analyze(sid):
+        # Contain failures to their own sensor so the others still get reported
+        lines = []
+        try:
+            return lines, analyze_sensor(sid, session, log=lines.append)
+        except Exception as e:
+            lines.append(f"  ✗ Analysis failed: {e}")
+            return lines, None
+
+    with session, ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {ex.submit(analyze, sid): sid for sid in SENSORS}
+        for future in as_completed(futures):
+            analyzed[futures[future]] = future.result()
+
     sensor_results = {}  # {sid: (name, stats_dict)}
 
     for sid, name in SENSORS.items():
         print(f"\n[{name}] (Sensor {sid})")
 
-        csv_data = fetch_sensor_history(sid)
-        if not csv_data:
+        lines, stats = analyzed[sid]
+        for line in lines:
+            print(line)
+        if stats is None:
             continue
 
-        df = parse_csv_data(csv_data)
-        if df is None or len(df) == 0:
-            print(f"  ✗ No valid data. Skipping.")
-            continue
-
-        stats = compute_stats(df)
         sensor_results[sid] = (name, stats)
 
         # Print quick summary to console
@@ -481,20 +511,21 @@ def main():
 
     output_file = f"sensor_report_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx"
 
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-        ws_sum = writer.book.create_sheet('Summary', 0)
-        ws_sum.sheet_properties.tabColor = ACCENT
-        write_summary_sheet(ws_sum, sensor_results)
+    with pd.ExcelWriter(output_file, engine='xlsxwriter',
+                        engine_kwargs={'options': {'constant_memory': True,
+                                                   'nan_inf_to_errors': True}}) as writer:
+        wb = writer.book
+        fmt = make_formats(wb)
 
-        for sid, (name, s) in sensor_results.items():
-            detail_name = f"Stats - {name[:22]}"
-            ws_det = writer.book.create_sheet(detail_name)
-            write_detailed_sheet(ws_det, sid, name, s)
+        ws_sum = wb.add_worksheet('Summary')
+        ws_sum.set_tab_color(f'#{ACCENT}')
+        write_summary_sheet(ws_sum, sensor_results, fmt)
 
-        write_raw_sheets(writer, sensor_results)
+        for sid, (name, s) in sensor_results.items():
+            ws_det = wb.add_worksheet(unique_sheet_name(wb, f"Stats - {name[:22]}"))
+            write_detailed_sheet(ws_det, sid, name, s, fmt)
 
-        if 'Sheet' in writer.book.sheetnames:
-            del writer.book['Sheet']
+        write_raw_sheets(wb, sensor_results, fmt)
 
     print(f"\n✓ Report saved: {output_file}")
     print(f"  {len(sensor_results)} sensor(s) included.")
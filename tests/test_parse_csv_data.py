@@ -0,0 +1,53 @@
+# test_parse_csv_data.py - Regression checks for PRTG CSV parsing
+import os
+import sys
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# prtg_report loads config.json at import time; feed it a stub instead
+CONFIG = b'{"prtg": {"url": "https://prtg.example", "username": "u", "password": "p"}, "sensors": {"1": "Test"}}'
+
+with mock.patch('builtins.open', mock.mock_open(read_data=CONFIG)):
+    import prtg_report
+
+HEADER = ('"Date Time","Date Time(RAW)","Temperature","Temperature(RAW)",'
+          '"Coverage","Coverage(RAW)"\n')
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeSession:
+    def __init__(self, text):
+        self.text = text
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.text)
+
+
+def test_parses_readings_and_drops_summary_rows():
+    csv_data = HEADER + (
+        '"13.02.2026 14:30:00 - 14:35:00","46066.6","22 °C","22.3","100 %","1"\n'
+        '"13.02.2026 14:35:00 - 14:40:00","46066.6","No data","","0 %","0"\n'
+        '"Averages","","22 °C","22.3","100 %","1"\n'
+    )
+    df = prtg_report.parse_csv_data(csv_data, log=lambda line: None)
+    assert list(df.columns) == ['DateTime', 'Temperature']
+    assert df['Temperature'].tolist() == [22.0]
+
+
+def test_header_only_csv_yields_no_readings():
+    # PRTG returns just the header for a paused sensor or an empty date range
+    df = prtg_report.parse_csv_data(HEADER, log=lambda line: None)
+    assert len(df) == 0
+
+
+def test_header_only_sensor_is_skipped():
+    lines = []
+    assert prtg_report.analyze_sensor(1, FakeSession(HEADER), log=lines.append) is None
+    assert lines[-1] == "  ✗ No valid data. Skipping."